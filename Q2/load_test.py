@@ -1,27 +1,51 @@
 import random
+import time
 from datetime import datetime, timezone
 from locust import HttpUser, task, constant
 
+BROWSERS = ("Chrome", "Firefox", "Safari", "Edge")
+
+# ISO timestamp cache, regenerated at most once per millisecond. The load
+# generator doesn't need sub-ms timestamps, and skipping the datetime
+# allocation + strftime on every request raises the client-side RPS ceiling.
+_last_ms = 0
+_iso_cache = ""
+
+def _iso_now() -> str:
+    global _last_ms, _iso_cache
+    ms = time.time_ns() // 1_000_000
+    if ms != _last_ms:
+        _iso_cache = datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat()
+        _last_ms = ms
+    return _iso_cache
+
 class FirehoseUser(HttpUser):
     # constant(0) ensures the user fires requests as fast as possible without sleeping,
     # helping to reach the high throughput target.
     wait_time = constant(0)
 
+    def on_start(self):
+        # Per-user RNG avoids contending on the shared random module state,
+        # and the constant part of the payload is built once instead of per
+        # request.
+        self.rng = random.Random()
+        self.static_fields = {"action": "click", "component": "hero_banner"}
+
     @task
     def send_event(self):
+        rng = self.rng
         payload = {
-            "user_id": random.randint(1, 1000000),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "user_id": rng.randrange(1, 1_000_001),
+            "timestamp": _iso_now(),
             "metadata": {
-                "browser": random.choice(["Chrome", "Firefox", "Safari", "Edge"]),
-                "version": random.randint(1, 120),
-                "click_x": random.randint(0, 1920),
-                "click_y": random.randint(0, 1080),
-                "action": "click",
-                "component": "hero_banner"
+                "browser": rng.choice(BROWSERS),
+                "version": rng.randrange(1, 121),
+                "click_x": rng.randrange(0, 1921),
+                "click_y": rng.randrange(0, 1081),
+                **self.static_fields,
             }
         }
-        
+
         # We expect a 202 Accepted response
         with self.client.post("/event", json=payload, catch_response=True) as response:
             if response.status_code == 202:
@@ -1,39 +1,51 @@
 from fastapi import FastAPI, HTTPException, status
-from sqlalchemy.exc import OperationalError, TimeoutError
-from database import get_transaction
+from sqlalchemy.exc import DBAPIError, TimeoutError
+from database import get_async_transaction
 from sql_loader import execute_sql
+import asyncio
 import os
 import time
 import random
 
 app = FastAPI()
 
+# Decorrelated-jitter backoff (AWS style). Plain exponential backoff gives
+# every colliding client the same retry schedule, so they re-collide in
+# waves; sampling uniform(base, prev*3) decorrelates the herd while the cap
+# bounds worst-case added latency.
+BACKOFF_BASE_SECONDS = 0.01
+BACKOFF_CAP_SECONDS = 0.2
+
+def next_backoff(prev_sleep: float) -> float:
+    return min(BACKOFF_CAP_SECONDS, random.uniform(BACKOFF_BASE_SECONDS, prev_sleep * 3))
+
 @app.post("/buy_ticket")
-def buy_ticket():
+async def buy_ticket():
     """
     Attempts to buy a ticket for 'Item A' using raw SQL.
-    Uses Row-Level Locking (SELECT ... FOR UPDATE) to ensure strict consistency.
+    A single atomic UPDATE ... RETURNING CTE guarantees strict consistency:
+    the conditional decrement takes the row lock implicitly, so no explicit
+    SELECT ... FOR UPDATE (and its extra round-trip) is needed.
+    Runs async over asyncpg, so DB waits suspend the coroutine instead of
+    blocking a threadpool worker.
     """
     start_time = time.monotonic()
     retry_budget_seconds = float(os.getenv("DB_RETRY_BUDGET_SECONDS", "2.0"))
     attempts = 0
+    sleep_s = BACKOFF_BASE_SECONDS
     while True:
         try:
-            with get_transaction() as conn:
-                result = execute_sql(conn, "get_item_for_update", {"item_id": "Item A"})
-                item = result.fetchone()
-
-                if not item:
-                    raise HTTPException(status_code=500, detail="Item not found")
-
-                if item.count <= 0:
-                    raise HTTPException(status_code=status.HTTP_410_GONE, detail="Sold out")
-
-                purchase_result = execute_sql(conn, "buy_ticket", {"item_id": "Item A"})
+            async with get_async_transaction() as conn:
+                purchase_result = await execute_sql(conn, "buy_ticket", {"item_id": "Item A"})
                 purchase = purchase_result.fetchone()
 
                 if not purchase:
-                    raise HTTPException(status_code=500, detail="Purchase failed")
+                    # Cold path: the decrement matched no row, either because
+                    # stock hit zero or the item doesn't exist at all
+                    item_result = await execute_sql(conn, "get_item", {"item_id": "Item A"})
+                    if not item_result.fetchone():
+                        raise HTTPException(status_code=500, detail="Item not found")
+                    raise HTTPException(status_code=status.HTTP_410_GONE, detail="Sold out")
 
                 return {
                     "status": "success",
@@ -48,9 +60,14 @@ def buy_ticket():
             if time.monotonic() - start_time >= retry_budget_seconds:
                 raise HTTPException(status_code=500, detail="Database busy, please retry")
             attempts += 1
-            time.sleep(min(0.2, 0.01 * (2 ** (attempts - 1))) + random.random() * 0.01)
+            sleep_s = next_backoff(sleep_s)
+            await asyncio.sleep(sleep_s)
             continue
-        except OperationalError as e:
+        except DBAPIError as e:
+            # The asyncpg dialect surfaces driver errors through its generic
+            # DBAPI shim, so deadlocks / lock timeouts / serialization
+            # failures arrive wrapped as DBAPIError rather than
+            # OperationalError; the shim still carries pgcode.
             if time.monotonic() - start_time >= retry_budget_seconds:
                 raise HTTPException(status_code=500, detail="Database busy, please retry")
             attempts += 1
@@ -58,7 +75,8 @@ def buy_ticket():
             if attempts <= 8 and (
                 pgcode in {"40P01", "55P03", "40001"} or getattr(e, "connection_invalidated", False)
             ):
-                time.sleep(0.01 * (2 ** (attempts - 1)) + random.random() * 0.01)
+                sleep_s = next_backoff(sleep_s)
+                await asyncio.sleep(sleep_s)
                 continue
             raise HTTPException(status_code=500, detail="Database operational error")
         except Exception as e:
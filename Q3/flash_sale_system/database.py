@@ -9,7 +9,8 @@ Tuned for high-concurrency flash sale scenarios.
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from contextlib import contextmanager
+from sqlalchemy.ext.asyncio import create_async_engine
+from contextlib import contextmanager, asynccontextmanager
 
 # Load .env file from the current directory or parent directory
 load_dotenv()  # looks in current directory
@@ -20,6 +21,9 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError('DATABASE_URL is not set.')
 
+# The async engine needs the asyncpg driver in the URL
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
 # Pool configuration from environment (with sensible defaults for flash sales)
 POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
 MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
@@ -36,6 +40,19 @@ engine = create_engine(
     pool_pre_ping=True,             # Verify connection health before use
 )
 
+# Async engine for the request path: DB round-trips become real suspension
+# points, so one Uvicorn worker can overlap hundreds of in-flight buys
+# instead of parking a threadpool thread per request. The sync engine above
+# stays for the management scripts (reset_db, proof_of_correctness).
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+
 
 @contextmanager
 def get_connection():
@@ -65,3 +82,17 @@ def get_transaction():
     """
     with engine.begin() as conn:
         yield conn
+
+
+@asynccontextmanager
+async def get_async_transaction():
+    """
+    Async context manager for database transactions.
+    Auto-commits on success, auto-rollbacks on exception.
+
+    Usage:
+        async with get_async_transaction() as conn:
+            result = await conn.execute(text("UPDATE inventory SET count = count - 1"))
+    """
+    async with async_engine.begin() as conn:
+        yield conn
@@ -0,0 +1,5 @@
+-- Plain read of an inventory row (no lock)
+-- Used on the cold path to distinguish "sold out" from "item missing"
+SELECT id, count
+FROM inventory
+WHERE id = :item_id;
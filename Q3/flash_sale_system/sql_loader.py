@@ -34,6 +34,23 @@ def load_sql(name: str) -> str:
     return path.read_text()
 
 
+@lru_cache(maxsize=50)
+def load_statement(name: str):
+    """
+    Load a SQL script as a ready-to-execute TextClause.
+    Caching the constructed clause (not just the string) means hot
+    statements skip the text() construction and let SQLAlchemy reuse its
+    compiled form instead of re-compiling the binds on every call.
+
+    Args:
+        name: Script name without .sql extension (e.g., "buy_ticket")
+
+    Returns:
+        A sqlalchemy TextClause for the script
+    """
+    return text(load_sql(name))
+
+
 def execute_sql(conn, name: str, params: dict = None):
     """
     Execute a named SQL script with safe parameterized queries.
@@ -50,8 +67,7 @@ def execute_sql(conn, name: str, params: dict = None):
         result = execute_sql(conn, "buy_ticket", {"item_id": "Item A"})
         row = result.fetchone()
     """
-    sql = text(load_sql(name))
-    return conn.execute(sql, params or {})
+    return conn.execute(load_statement(name), params or {})
 
 
 def execute_sql_script(conn, name: str):